@@ -1,206 +1,678 @@
 """
 AWS Lambda handlers for website status checker.
 """
-import json
+import asyncio
+import re
 import time
 import os
+from functools import lru_cache
 import ipaddress
-from datetime import datetime
+from decimal import Decimal
 from urllib.parse import urlparse
 import socket
+import aioboto3
+import aiohttp
 import boto3
+import orjson
+from aiobotocore.config import AioConfig
 from boto3.dynamodb.conditions import Key
+from botocore.config import Config
 from botocore.exceptions import ClientError
-import requests
 
 
-# Initialize DynamoDB client (lazy initialization for testing)
-_dynamodb = None
-_table = None
+# Response headers are identical on every return path, so build the dict once
+_CORS_HEADERS = {
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*'
+}
+
+
+def _json_default(value):
+    """Serialize the Decimals boto3 returns for Number attributes as numbers."""
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def _resp(status_code, body):
+    """
+    Build an API Gateway response.
+
+    Args:
+        status_code (int): HTTP status code
+        body: Response payload; either a dict to serialize or an
+            already-serialized JSON string
+
+    Returns:
+        dict: API Gateway response with status code and body
+    """
+    if not isinstance(body, str):
+        body = orjson.dumps(body, default=_json_default).decode()
+    return {
+        'statusCode': status_code,
+        'headers': _CORS_HEADERS,
+        'body': body
+    }
+
+
+def _parse_body(event):
+    """
+    Parse a request body without redundant decoding.
+
+    Direct invokes and tests pass an already-parsed dict, which is
+    returned as-is; API Gateway string/bytes bodies go straight through
+    orjson.loads, which accepts both without an intermediate str.
+    """
+    raw = event.get('body') or event
+    return raw if isinstance(raw, dict) else orjson.loads(raw)
+
+
+# Static error bodies, serialized once at import time
+_ERR_INVALID_JSON = orjson.dumps({'error': 'Invalid JSON in request body'}).decode()
+_ERR_URL_REQUIRED = orjson.dumps({'error': 'URL parameter is required'}).decode()
+_ERR_URLS_REQUIRED = orjson.dumps({'error': 'A non-empty "urls" list is required'}).decode()
+
+
+_TABLE_NAME = os.environ.get('DYNAMODB_TABLE', 'website-status-checks')
+
+# Initialize DynamoDB at module import so the TLS handshake, credential
+# resolution and endpoint discovery happen during Lambda's INIT phase
+# instead of on the first billed invocation.
+_dynamodb = boto3.resource(
+    'dynamodb',
+    config=Config(
+        max_pool_connections=50,
+        retries={'max_attempts': 2, 'mode': 'standard'},
+        tcp_keepalive=True
+    )
+)
+_table = _dynamodb.Table(_TABLE_NAME)
+# Touching the endpoint forces endpoint resolution during INIT
+_ = _dynamodb.meta.client._endpoint.host
+
+# When set, check results are enqueued here instead of written to
+# DynamoDB on the critical path; a drain Lambda batches them in.
+_RESULT_SQS_URL = os.environ.get('RESULT_SQS_URL')
+
+# Async resources for the check handler. The event loop, aiohttp session
+# and low-level aiobotocore clients are created once and cached in module
+# globals so they survive warm Lambda invocations. The DynamoDB client and
+# the outbound TCPConnector share keepalive_timeout=75 so an idle container
+# retains warm sockets to both endpoints between invokes.
+_KEEPALIVE_TIMEOUT = 75
+_AIO_CONFIG = AioConfig(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    connector_args={'keepalive_timeout': _KEEPALIVE_TIMEOUT}
+)
+_event_loop = None
+_aioboto3_session = aioboto3.Session()
+_async_http_session = None
+_async_ddb = None
+_async_sqs = None
+
+
+def _get_event_loop():
+    """Get or create the event loop shared across warm invocations."""
+    global _event_loop
+    if _event_loop is None:
+        _event_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_event_loop)
+    return _event_loop
+
+
+async def _get_async_http_session():
+    """Get or initialize the shared aiohttp client session."""
+    global _async_http_session
+    if _async_http_session is None:
+        connector = aiohttp.TCPConnector(
+            limit=50,
+            keepalive_timeout=_KEEPALIVE_TIMEOUT,
+            resolver=_ValidatedResolver()
+        )
+        _async_http_session = aiohttp.ClientSession(connector=connector)
+    return _async_http_session
+
+
+async def _get_async_ddb():
+    """Get or initialize the low-level async DynamoDB client.
+
+    The low-level client skips the Resource layer's per-attribute Python
+    conversion on every call; items are marshaled once via _marshal_item.
+    """
+    global _async_ddb
+    if _async_ddb is None:
+        _async_ddb = await _aioboto3_session.client('dynamodb', config=_AIO_CONFIG).__aenter__()
+    return _async_ddb
+
+
+async def _get_async_sqs():
+    """Get or initialize the aioboto3 SQS client for deferred result writes."""
+    global _async_sqs
+    if _async_sqs is None:
+        _async_sqs = await _aioboto3_session.client('sqs').__aenter__()
+    return _async_sqs
+
+
+async def _warm_async_clients():
+    """Open the aiohttp session and DynamoDB client and prime their pools."""
+    await _get_async_http_session()
+    ddb = await _get_async_ddb()
+    await ddb.describe_table(TableName=_TABLE_NAME)
+
+
+# Prime connection pools during Lambda INIT: one no-op DynamoDB call pays
+# the TLS handshake, credential fetch and endpoint discovery before the
+# first billed request (free under provisioned concurrency, and not billed
+# as request duration in on-demand's INIT segment). Skipped outside Lambda
+# so local imports stay fast.
+if os.environ.get('AWS_LAMBDA_FUNCTION_NAME'):
+    try:
+        _table.meta.client.describe_table(TableName=_table.name)
+        _get_event_loop().run_until_complete(_warm_async_clients())
+    except Exception as e:
+        print(f"Warmup skipped: {e}")
+
+
+# When a DAX cluster endpoint is configured, history reads go through it;
+# cache hits return in microseconds instead of DynamoDB's single-digit ms.
+# Writes keep going directly to DynamoDB (DAX invalidates on write).
+_dax_table = None
+if os.environ.get('DAX_ENDPOINT'):
+    import amazondax
+    _dax = amazondax.AmazonDaxClient.resource(endpoint_url=os.environ['DAX_ENDPOINT'])
+    _dax_table = _dax.Table(_TABLE_NAME)
 
 
 def get_table():
-    """Get or initialize DynamoDB table."""
-    global _dynamodb, _table
-    if _table is None:
-        _dynamodb = boto3.resource('dynamodb')
-        table_name = os.environ.get('DYNAMODB_TABLE', 'website-status-checks')
-        _table = _dynamodb.Table(table_name)
+    """Get the DynamoDB table initialized at import time."""
     return _table
 
 
-def validate_url(url):
+def get_read_table():
+    """Get the table used for reads: DAX when configured, else DynamoDB."""
+    return _dax_table if _dax_table is not None else _table
+
+
+# DNS results are cached with a TTL so warm containers checking the same
+# URLs repeatedly skip the blocking resolver round trip. The cache is
+# size-bounded so a stream of unique hostnames can't grow it without
+# limit in a warm container.
+_DNS_CACHE_TTL_SECONDS = 300
+_DNS_CACHE_MAX_ENTRIES = 2048
+_dns_cache = {}
+
+# Blocked ranges precomputed as (network_int, netmask_int) pairs so each
+# resolved address is classified with one mask-and-compare per range instead
+# of the is_private/is_loopback/is_link_local/is_reserved property chain,
+# each of which walks its own list of network objects.
+_BLOCKED_V4 = [
+    (int(n.network_address), int(n.netmask))
+    for n in map(ipaddress.IPv4Network, (
+        '0.0.0.0/8', '10.0.0.0/8', '100.64.0.0/10', '127.0.0.0/8',
+        '169.254.0.0/16', '172.16.0.0/12', '192.0.0.0/24', '192.0.2.0/24',
+        '192.168.0.0/16', '198.18.0.0/15', '198.51.100.0/24',
+        '203.0.113.0/24', '224.0.0.0/4', '240.0.0.0/4'
+    ))
+]
+_BLOCKED_V6 = [
+    (int(n.network_address), int(n.netmask))
+    for n in map(ipaddress.IPv6Network, (
+        '::/128', '::1/128', '::ffff:0:0/96', 'fc00::/7', 'fe80::/10', 'ff00::/8'
+    ))
+]
+
+
+def _is_blocked_ip(ip):
+    """Check an address against the private/internal range tables."""
+    ip_int = int(ip)
+    table = _BLOCKED_V4 if ip.version == 4 else _BLOCKED_V6
+    return any(ip_int & netmask == network for network, netmask in table)
+
+
+def _check_resolved_addresses(hostname):
     """
-    Validate URL format and check for SSRF vulnerabilities.
-    
+    Resolve hostname and verify that no resolved address is private/internal.
+
+    Results are cached per hostname with a TTL, turning the per-request
+    resolver syscall into a dict lookup on warm containers. Every address
+    returned by the resolver is checked, not just the first A record, and
+    the addresses are kept in the cache so _ValidatedResolver can pin
+    connections to exactly what was validated.
+
+    Args:
+        hostname (str): Hostname to resolve
+
+    Returns:
+        tuple: (is_allowed, error_message, addr_info) - addr_info is the
+            getaddrinfo result, or None if resolution failed
+    """
+    entry = _dns_cache.get(hostname)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1], entry[2], entry[3]
+
+    try:
+        addr_info = socket.getaddrinfo(hostname, None, type=socket.SOCK_STREAM)
+    except socket.gaierror:
+        # If DNS resolution fails, we'll let the HTTP client handle it
+        # This allows the function to work even if the hostname doesn't exist yet
+        return True, None, None
+
+    is_allowed = True
+    error_message = None
+    for family, _, _, _, sockaddr in addr_info:
+        try:
+            ip = ipaddress.ip_address(sockaddr[0])
+        except ValueError:
+            continue
+        if _is_blocked_ip(ip):
+            is_allowed = False
+            error_message = "Access to private/internal IP addresses is not allowed"
+            break
+
+    if len(_dns_cache) >= _DNS_CACHE_MAX_ENTRIES:
+        now = time.monotonic()
+        for host in [h for h, e in _dns_cache.items() if e[0] <= now]:
+            del _dns_cache[host]
+        # Still full after dropping expired entries: reset rather than grow
+        if len(_dns_cache) >= _DNS_CACHE_MAX_ENTRIES:
+            _dns_cache.clear()
+
+    _dns_cache[hostname] = (
+        time.monotonic() + _DNS_CACHE_TTL_SECONDS, is_allowed, error_message, addr_info
+    )
+    return is_allowed, error_message, addr_info
+
+
+class _ValidatedResolver(aiohttp.abc.AbstractResolver):
+    """
+    Resolver that serves connections the exact addresses validate_url checked.
+
+    aiohttp would otherwise do its own DNS lookup at connect time, so an
+    attacker-controlled nameserver could hand the validation pass a public
+    address and the connection a private one (DNS rebinding). Answering
+    from the validated TTL cache closes that window and saves the second
+    resolver round trip per request.
+    """
+
+    async def resolve(self, host, port=0, family=socket.AF_UNSPEC):
+        # Off the loop: _check_resolved_addresses blocks on getaddrinfo on a
+        # cache miss. Re-running it here also covers hostnames whose DNS
+        # failed during validation - the retry goes through the same
+        # private-range check and TTL cache, never an unchecked lookup.
+        loop = asyncio.get_running_loop()
+        is_allowed, error_message, addr_info = await loop.run_in_executor(
+            None, _check_resolved_addresses, host
+        )
+        if not is_allowed:
+            raise OSError(f"Blocked address for {host}: {error_message}")
+        if addr_info is None:
+            raise OSError(f"DNS resolution failed for {host}")
+        return [
+            {
+                'hostname': host,
+                'host': sockaddr[0],
+                'port': port,
+                'family': fam,
+                'proto': proto,
+                'flags': socket.AI_NUMERICHOST
+            }
+            for fam, _, proto, _, sockaddr in addr_info
+            if family in (socket.AF_UNSPEC, fam)
+        ]
+
+    async def close(self):
+        pass
+
+
+_ALLOWED_SCHEMES = frozenset(('http', 'https'))
+
+# Cheap pre-filter: rejects clearly malformed URLs (missing http(s) scheme,
+# whitespace/control characters, over-long) before paying for urlparse,
+# hostname extraction and DNS
+_URL_FASTPATH = re.compile(r'^https?://[^\s/$.?#][^\s]{0,2047}$', re.IGNORECASE)
+
+
+@lru_cache(maxsize=2048)
+def _validate_url_syntax(url):
+    """
+    Validate URL format and extract the hostname (memoized).
+
+    Syntactic validation is a pure function of the URL, so both positive
+    and negative results are cached and repeat checks of the same URL
+    skip urlparse entirely. DNS-dependent checks stay out of this cache
+    and keep their own TTL in _check_resolved_addresses.
+
     Args:
         url (str): URL to validate
-        
+
     Returns:
-        tuple: (is_valid, error_message)
+        tuple: (is_valid, error_message, hostname)
     """
-    if not url:
-        return False, "URL is required"
-    
-    if not isinstance(url, str):
-        return False, "URL must be a string"
-    
     try:
         result = urlparse(url)
         if not all([result.scheme, result.netloc]):
-            return False, "Invalid URL format"
-        
-        if result.scheme not in ['http', 'https']:
-            return False, "URL must use http or https protocol"
-        
+            return False, "Invalid URL format", None
+
+        if result.scheme not in _ALLOWED_SCHEMES:
+            return False, "URL must use http or https protocol", None
+
         # Extract hostname (without port)
         hostname = result.hostname
         if not hostname:
-            return False, "Invalid hostname"
-        
+            return False, "Invalid hostname", None
+
         # Block localhost and loopback addresses
         if hostname.lower() in ['localhost', '127.0.0.1', '::1']:
-            return False, "Access to localhost is not allowed"
-        
-        # Try to resolve hostname to IP and check for private ranges
-        try:
-            # Get IP address
-            ip_str = socket.gethostbyname(hostname)
-            ip = ipaddress.ip_address(ip_str)
-            
-            # Block private IP ranges (RFC 1918, RFC 4193)
-            if ip.is_private or ip.is_loopback or ip.is_link_local or ip.is_reserved:
-                return False, "Access to private/internal IP addresses is not allowed"
-        except socket.gaierror:
-            # If DNS resolution fails, we'll let requests handle it
-            # This allows the function to work even if the hostname doesn't exist yet
-            pass
-        except ValueError:
-            # Invalid IP format - continue with validation
-            pass
-        
-        return True, None
+            return False, "Access to localhost is not allowed", None
+
+        return True, None, hostname
     except Exception as e:
-        return False, f"Invalid URL: {str(e)}"
+        return False, f"Invalid URL: {str(e)}", None
 
 
-def check_website_status(event, context):
+def validate_url(url):
     """
-    Lambda handler for POST endpoint to check website status.
-    
-    Expected input: {"url": "https://example.com"}
-    
+    Validate URL format and check for SSRF vulnerabilities.
+
+    Args:
+        url (str): URL to validate
+
     Returns:
-        dict: API Gateway response with status code and body
+        tuple: (is_valid, error_message)
+    """
+    if not url:
+        return False, "URL is required"
+
+    if not isinstance(url, str):
+        return False, "URL must be a string"
+
+    # Fast-path rejection ahead of the memoized parse, so over-long or
+    # clearly malformed input is dropped before it can become a cache key
+    if len(url) > 2048 or not _URL_FASTPATH.match(url):
+        return False, "Invalid URL format"
+
+    is_valid, error_message, hostname = _validate_url_syntax(url)
+    if not is_valid:
+        return False, error_message
+
+    # Resolve hostname (TTL-cached) and check every address for private ranges
+    is_allowed, resolve_error, _ = _check_resolved_addresses(hostname)
+    if not is_allowed:
+        return False, resolve_error
+
+    return True, None
+
+
+def _marshal_item(item):
+    """
+    Build the DynamoDB wire format for a check item directly.
+
+    The item schema is fixed, so each attribute is formatted in place
+    instead of walking every value through TypeSerializer's Python-level
+    type dispatch - no Decimal conversion needed either, since N values
+    are just strings on the wire.
+    """
+    marshaled = {
+        'url': {'S': item['url']},
+        'timestamp_us': {'N': str(item['timestamp_us'])},
+        'status_code': {'N': str(item['status_code'])},
+        'latency_ms': {'N': format(item['latency_ms'], '.2f')},
+        'success': {'BOOL': item['success']}
+    }
+    if 'error' in item:
+        marshaled['error'] = {'S': item['error']}
+    return marshaled
+
+
+async def _batch_write_items(ddb, items):
+    """
+    Write items with BatchWriteItem in chunks of 25, retrying unprocessed
+    items with exponential backoff.
+    """
+    for start in range(0, len(items), 25):
+        request_items = {
+            _TABLE_NAME: [
+                {'PutRequest': {'Item': _marshal_item(item)}}
+                for item in items[start:start + 25]
+            ]
+        }
+        backoff = 0.05
+        while request_items:
+            response = await ddb.batch_write_item(RequestItems=request_items)
+            request_items = response.get('UnprocessedItems') or None
+            if request_items:
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 1.0)
+
+
+# Body bytes drained before a response connection is abandoned. Small
+# bodies are consumed fully so the socket returns to the keep-alive pool;
+# larger ones aren't worth the billed milliseconds to keep reading.
+_MAX_DRAIN_BYTES = 65536
+
+
+async def _drain_response(response):
+    """
+    Consume up to _MAX_DRAIN_BYTES of a response body, then release it.
+
+    The status check discards the body, so anything beyond the cap is
+    aborted by closing the connection - bounding per-check wall time,
+    bandwidth and memory even for huge or slow-transfer targets - at the
+    cost of that one connection not being reused.
+    """
+    try:
+        drained = 0
+        async for chunk in response.content.iter_chunked(8192):
+            drained += len(chunk)
+            if drained >= _MAX_DRAIN_BYTES:
+                response.close()
+                break
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        pass
+    finally:
+        response.release()
+
+
+async def _fetch_status(session, url):
+    """
+    Fetch a URL, measure latency and build the DynamoDB item for the result.
+
+    Args:
+        session (aiohttp.ClientSession): Session to issue the request on
+        url (str): URL to check
+
+    Returns:
+        tuple: (item, response) - response is None if the request failed
+            and has not been drained yet otherwise
+    """
+    timeout = aiohttp.ClientTimeout(connect=3.05, total=10)
+    response = None
+    error_detail = None
+    # Monotonic counter: one read per request regardless of outcome, and
+    # immune to wall-clock adjustments during long timeouts
+    t0 = time.perf_counter_ns()
+    try:
+        # HEAD first: same status for the vast majority of sites at ~0 body
+        # bytes. Servers that reject it get the old GET behavior.
+        response = await session.head(url, timeout=timeout, allow_redirects=True)
+        if response.status in (405, 501):
+            response.release()
+            response = await session.get(url, timeout=timeout, allow_redirects=True)
+        status_code = response.status
+        success = 200 <= status_code < 400
+    except asyncio.TimeoutError:
+        status_code = 0
+        success = False
+        error_detail = "Request timeout"
+    except aiohttp.ClientError as e:
+        status_code = 0
+        success = False
+        error_detail = str(e)
+    finally:
+        latency_ms = (time.perf_counter_ns() - t0) / 1e6
+
+    # Epoch microseconds as a Number sort key: cheaper to produce than an
+    # ISO 8601 string and fewer bytes for DynamoDB to store and compare
+    item = {
+        'url': url,
+        'timestamp_us': time.time_ns() // 1000,
+        'status_code': status_code,
+        'latency_ms': round(latency_ms, 2),
+        'success': success
+    }
+
+    if not success and error_detail is not None:
+        item['error'] = error_detail
+
+    return item, response
+
+
+async def _check_website_status_async(event):
+    """
+    Async implementation of the website status check.
+
+    The outbound HTTP fetch runs on the shared aiohttp session, and the
+    DynamoDB write is overlapped with draining the response body via
+    asyncio.gather so the two I/O waits don't serialize.
     """
     try:
         # Parse request body
-        if 'body' in event:
-            body = json.loads(event['body']) if isinstance(event['body'], str) else event['body']
-        else:
-            body = event
+        body = _parse_body(event)
         
         url = body.get('url')
         
         # Validate URL
         is_valid, error_message = validate_url(url)
         if not is_valid:
-            return {
-                'statusCode': 400,
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                },
-                'body': json.dumps({
-                    'error': error_message
-                })
-            }
+            return _resp(400, {'error': error_message})
         
         # Perform HTTP GET request and measure latency
-        start_time = time.time()
-        try:
-            response = requests.get(url, timeout=10, allow_redirects=True)
-            latency_ms = (time.time() - start_time) * 1000
-            status_code = response.status_code
-            success = 200 <= status_code < 400
-        except requests.exceptions.Timeout:
-            latency_ms = (time.time() - start_time) * 1000
-            status_code = 0
-            success = False
-            error_detail = "Request timeout"
-        except requests.exceptions.RequestException as e:
-            latency_ms = (time.time() - start_time) * 1000
-            status_code = 0
-            success = False
-            error_detail = str(e)
-        
-        # Prepare item for DynamoDB
-        timestamp = datetime.utcnow().isoformat() + 'Z'
-        item = {
-            'url': url,
-            'timestamp': timestamp,
-            'status_code': status_code,
-            'latency_ms': round(latency_ms, 2),
-            'success': success
-        }
-        
-        if not success and 'error_detail' in locals():
-            item['error'] = error_detail
-        
-        # Store in DynamoDB
+        session = await _get_async_http_session()
+        item, response = await _fetch_status(session, url)
+
+        # Store the result, overlapping the write with the body drain.
+        # With a result queue configured the write is a cheap SQS enqueue
+        # (a drain Lambda batches it into DynamoDB); otherwise write directly
+        if _RESULT_SQS_URL:
+            sqs = await _get_async_sqs()
+            put_task = asyncio.create_task(sqs.send_message(
+                QueueUrl=_RESULT_SQS_URL,
+                MessageBody=orjson.dumps(item).decode()
+            ))
+        else:
+            ddb = await _get_async_ddb()
+            put_task = asyncio.create_task(
+                ddb.put_item(TableName=_TABLE_NAME, Item=_marshal_item(item))
+            )
         try:
-            get_table().put_item(Item=item)
+            if response is not None:
+                await asyncio.gather(put_task, _drain_response(response))
+            else:
+                await put_task
         except ClientError as e:
             print(f"DynamoDB error: {e}")
-            return {
-                'statusCode': 500,
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                },
-                'body': json.dumps({
-                    'error': 'Failed to store check result',
-                    'details': str(e)
-                })
-            }
+            return _resp(500, {'error': 'Failed to store check result', 'details': str(e)})
         
         # Return success response
-        return {
-            'statusCode': 200,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps({
-                'message': 'Website status checked successfully',
-                'result': item
-            })
-        }
+        return _resp(200, {'message': 'Website status checked successfully', 'result': item})
         
-    except json.JSONDecodeError:
-        return {
-            'statusCode': 400,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps({
-                'error': 'Invalid JSON in request body'
-            })
-        }
+    except orjson.JSONDecodeError:
+        return _resp(400, _ERR_INVALID_JSON)
     except Exception as e:
         print(f"Unexpected error: {e}")
-        return {
-            'statusCode': 500,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps({
-                'error': 'Internal server error',
-                'details': str(e)
-            })
-        }
+        return _resp(500, {'error': 'Internal server error', 'details': str(e)})
+
+
+def check_website_status(event, context):
+    """
+    Lambda handler for POST endpoint to check website status.
+
+    Expected input: {"url": "https://example.com"}
+
+    Returns:
+        dict: API Gateway response with status code and body
+    """
+    return _get_event_loop().run_until_complete(_check_website_status_async(event))
+
+
+async def _check_website_status_batch_async(event):
+    """
+    Async implementation of the batched website status check.
+
+    All URLs are fetched concurrently and the results are written with
+    BatchWriteItem in chunks of 25, retrying unprocessed items - one
+    round trip per 25 checks instead of one per check.
+    """
+    try:
+        # Parse request body
+        body = _parse_body(event)
+
+        urls = body.get('urls')
+
+        if not isinstance(urls, list) or not urls:
+            return _resp(400, _ERR_URLS_REQUIRED)
+
+        # Validate up front; invalid URLs are reported but never fetched
+        results = []
+        valid_urls = []
+        for url in urls:
+            is_valid, error_message = validate_url(url)
+            if is_valid:
+                valid_urls.append(url)
+            else:
+                results.append({
+                    'url': url,
+                    'success': False,
+                    'error': error_message
+                })
+
+        # Fetch all valid URLs concurrently
+        session = await _get_async_http_session()
+        fetched = await asyncio.gather(*[_fetch_status(session, url) for url in valid_urls])
+
+        # Drain response bodies while the batched write is in flight
+        drain_tasks = [
+            asyncio.create_task(_drain_response(response))
+            for _, response in fetched if response is not None
+        ]
+
+        # Store in DynamoDB in batches of 25
+        try:
+            ddb = await _get_async_ddb()
+            await _batch_write_items(ddb, [item for item, _ in fetched])
+        except ClientError as e:
+            print(f"DynamoDB error: {e}")
+            return _resp(500, {'error': 'Failed to store check results', 'details': str(e)})
+        finally:
+            if drain_tasks:
+                await asyncio.gather(*drain_tasks)
+
+        results.extend(item for item, _ in fetched)
+
+        return _resp(200, {
+            'message': 'Website statuses checked successfully',
+            'count': len(results),
+            'results': results
+        })
+
+    except orjson.JSONDecodeError:
+        return _resp(400, _ERR_INVALID_JSON)
+    except Exception as e:
+        print(f"Unexpected error: {e}")
+        return _resp(500, {'error': 'Internal server error', 'details': str(e)})
+
+
+def check_website_status_batch(event, context):
+    """
+    Lambda handler for POST endpoint to check a batch of websites.
+
+    Expected input: {"urls": ["https://example.com", ...]}
+
+    Returns:
+        dict: API Gateway response with status code and body
+    """
+    return _get_event_loop().run_until_complete(_check_website_status_batch_async(event))
 
 
 def get_status_history(event, context):
@@ -222,16 +694,7 @@ def get_status_history(event, context):
         
         # Validate URL
         if not url:
-            return {
-                'statusCode': 400,
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                },
-                'body': json.dumps({
-                    'error': 'URL parameter is required'
-                })
-            }
+            return _resp(400, _ERR_URL_REQUIRED)
         
         # Validate limit
         try:
@@ -239,64 +702,64 @@ def get_status_history(event, context):
             if limit < 1 or limit > 100:
                 raise ValueError("Limit must be between 1 and 100")
         except (ValueError, TypeError) as e:
-            return {
-                'statusCode': 400,
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                },
-                'body': json.dumps({
-                    'error': f'Invalid limit parameter: {str(e)}'
-                })
-            }
+            return _resp(400, {'error': f'Invalid limit parameter: {str(e)}'})
         
         # Query DynamoDB
         try:
-            response = get_table().query(
+            response = get_read_table().query(
                 KeyConditionExpression=Key('url').eq(url),
                 ScanIndexForward=False,  # Sort by timestamp descending (newest first)
-                Limit=limit
+                Limit=limit,
+                # Only fetch what the client displays; 'url' and 'error' are
+                # aliased because URL is a DynamoDB reserved word
+                ProjectionExpression='#u, timestamp_us, status_code, latency_ms, success, #err',
+                ExpressionAttributeNames={'#u': 'url', '#err': 'error'}
             )
             
             items = response.get('Items', [])
             
-            return {
-                'statusCode': 200,
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                },
-                'body': json.dumps({
-                    'url': url,
-                    'count': len(items),
-                    'checks': items
-                })
-            }
+            return _resp(200, {
+                'url': url,
+                'count': len(items),
+                'checks': items
+            })
             
         except ClientError as e:
             print(f"DynamoDB error: {e}")
-            return {
-                'statusCode': 500,
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                },
-                'body': json.dumps({
-                    'error': 'Failed to query check history',
-                    'details': str(e)
-                })
-            }
+            return _resp(500, {'error': 'Failed to query check history', 'details': str(e)})
         
     except Exception as e:
         print(f"Unexpected error: {e}")
-        return {
-            'statusCode': 500,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps({
-                'error': 'Internal server error',
-                'details': str(e)
-            })
+        return _resp(500, {'error': 'Internal server error', 'details': str(e)})
+
+
+def drain_check_results(event, context):
+    """
+    Lambda handler draining queued check results from SQS into DynamoDB.
+
+    Triggered by the result queue; records are marshaled with
+    _marshal_item and written via BatchWriteItem in chunks of 25,
+    retrying unprocessed items. Records that fail to parse are logged
+    and skipped so one bad body doesn't poison the rest of the batch.
+    """
+    items = []
+    for record in event.get('Records', []):
+        try:
+            items.append(_marshal_item(orjson.loads(record['body'])))
+        except (orjson.JSONDecodeError, KeyError, TypeError) as e:
+            print(f"Skipping malformed result record {record.get('messageId')}: {e}")
+
+    client = _dynamodb.meta.client
+    for start in range(0, len(items), 25):
+        request_items = {
+            _TABLE_NAME: [
+                {'PutRequest': {'Item': item}} for item in items[start:start + 25]
+            ]
         }
+        backoff = 0.05
+        while request_items:
+            response = client.batch_write_item(RequestItems=request_items)
+            request_items = response.get('UnprocessedItems') or None
+            if request_items:
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 1.0)